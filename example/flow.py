@@ -1,5 +1,3 @@
-import pandas as pd
-
 import settings
 from raritan.context import context
 from raritan.decorators import flow, input_data, output_data, task
@@ -14,14 +12,16 @@ def get_data() -> dict:
     """
     Gets our flow data and stores it inside the context object.
     """
+    # Imported lazily so flows that never reach this task skip the pandas startup cost.
+    import pandas as pd
     return {
         settings.input_dir: {
             'labs_ongoing': {
                 'optional': False,
                 'file': 'labs_ongoing.csv',
                 'filters': {
-                    'dog_id_filter': ('id3'),
-                    'webform_id_filter': ('annual_owner', 'annual_veterinarian')
+                    'dog_id': ('id3',),
+                    'webform_id': ('annual_owner', 'annual_veterinarian'),
                 }
             },
             'labs_historical': 'labs_historical.csv',
@@ -29,7 +29,7 @@ def get_data() -> dict:
                 'optional': False,
                 'file': 'sample_ops_labs.tsv',
                 'filters': {
-                    'dog_id_filter': ('id1', 'id2', 'id3')
+                    'dog_id': ('id1', 'id2', 'id3'),
                 }
             }
         },
@@ -52,23 +52,31 @@ def transform_data():
     -----
     If this work becomes lengthy, we try to use a separate cleaning module.
     """
+    import pyarrow as pa
     data = [
         context.get_data_reference('labs_ongoing'),
         context.get_data_reference('labs_historical'),
     ]
-    complete_labs = pd.concat(data, ignore_index=True)
+    # Concatenate at the Arrow layer and stay columnar; the output handler writes
+    # tables directly, so no pandas materialization happens at all for this flow.
+    # Tasks that need pandas can call .to_pandas() on the reference as an escape hatch.
+    tables = [
+        item if isinstance(item, pa.Table) else pa.Table.from_pandas(item, preserve_index=False)
+        for item in data
+    ]
+    complete_labs = pa.concat_tables(tables, promote_options='default')
     context.set_data_reference('complete_labs', complete_labs)
 
 
 @output_data
 def output_data() -> dict:
     """
-    Outputs the data from context with csv and sql strategies.
+    Outputs the data from context, preferring parquet with csv as a legacy option.
     """
     return {
         settings.output_dir: {
             'complete_labs': {
-                'formats': ('csv', 'sql'),
+                'formats': ('parquet', 'csv'),
                 'output_kwargs': {},
             },
         },
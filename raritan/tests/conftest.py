@@ -0,0 +1,30 @@
+import pytest
+
+from raritan import logger
+
+"""
+Shared fixtures for the test suite.
+"""
+
+
+@pytest.fixture(autouse=True)
+def plain_console():
+    """
+    Keeps the console free of ANSI escapes for the duration of each test.
+
+    The tests only assert on substrings, so rendering color and style codes
+    into the capture buffer just forces a regex strip afterwards. Disabling
+    terminal detection and color makes captures plain text from the start.
+    """
+    console = logger.console
+    previous_force_terminal = console._force_terminal
+    previous_no_color = console.no_color
+    previous_width = console._width
+    console._force_terminal = False
+    console.no_color = True
+    # Wide enough that long tmp_path-based messages never wrap mid-assertion.
+    console._width = 300
+    yield
+    console._force_terminal = previous_force_terminal
+    console.no_color = previous_no_color
+    console._width = previous_width
@@ -1,6 +1,6 @@
 import pytest
 
-from raritan.context import context
+from raritan.context import _compile, context
 
 """
 Tests context getting.
@@ -22,13 +22,36 @@ def test_context() -> None:
     data = context.get_data_reference('data_source_a')
     assert data == 'Here is data for letter, a'
     data = context.get_data_reference('^data_source_*')
-    assert type(data) == dict
-    assert len(data.keys()) == 4
+    assert isinstance(data, dict)
+    assert len(data) == 4
     data = context.get_data_reference(['a_random_one', 'data_source_c'])
-    assert type(data) == dict
-    assert len(data.keys()) == 2
+    assert isinstance(data, dict)
+    assert len(data) == 2
     bad_requests = ('Noids', 7, ['Still', 'Nope'])
     for bad_request in bad_requests:
         with pytest.raises(Exception):
             context.get_data_reference(bad_request)
 
+
+def test_pattern_lookup_with_alternation() -> None:
+    """
+    Tests that alternation patterns match every branch, not just the first.
+    """
+    context.set_data_reference('labs_ongoing', 'Labs data.')
+    context.set_data_reference('samples_ops', 'Samples data.')
+    data = context.get_data_reference('labs|samples')
+    assert {'labs_ongoing', 'samples_ops'} <= set(data)
+
+
+def test_pattern_lookup_reuses_compiled_patterns() -> None:
+    """
+    Tests that repeated pattern lookups hit the compiled-regex cache.
+    """
+    for letter in ('a', 'b', 'c', 'd'):
+        context.set_data_reference(f'data_source_{letter}', f'Here is data for letter, {letter}')
+    _compile.cache_clear()
+    for _ in range(100):
+        context.get_data_reference('^data_source_*')
+    info = _compile.cache_info()
+    assert info.misses == 1
+    assert info.hits >= 99
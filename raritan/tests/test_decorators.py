@@ -1,8 +1,10 @@
-import glob
 import os.path
-import re
+import shutil
+import time
 from time import sleep
 
+import pytest
+
 from raritan.context import context
 from raritan.decorators import flow, input_data, output_data, task
 from raritan.logger import console, error
@@ -17,6 +19,58 @@ context.set_exit_on_error(False)
 
 settings = context.get_settings()
 
+# Where the committed input fixtures live; each test gets its own copy.
+FIXTURE_DIR = settings.data_dir
+
+# Rebound per test by isolated_data_dir, read by the asset maps at call time.
+DATA_DIR = settings.data_dir
+
+# Content fingerprints of the fixture data, defined once so a hash change is a
+# single-point update.
+SINGLE_FIXTURE_DIGEST = '72dcd4140b'
+FIXTURE_GROUP_DIGEST = 'eab731f896'
+DIFFERENT_FIXTURE_GROUP_DIGEST = '2445d04a62'
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch) -> str:
+    """
+    Points each test at its own data directory.
+
+    Outputs land in a per-test tmp_path that pytest removes itself, so tests
+    no longer share the fixture directory and can run in parallel workers
+    without colliding; explicit teardown becomes unnecessary.
+    """
+    shutil.copy(f'{FIXTURE_DIR}/test.txt', tmp_path)
+    data_dir = str(tmp_path)
+    monkeypatch.setattr(settings, 'data_dir', data_dir)
+    monkeypatch.setattr(f'{__name__}.DATA_DIR', data_dir)
+    context.clear_data_references()
+    yield data_dir
+
+
+@pytest.fixture(autouse=True)
+def fake_clock(monkeypatch) -> None:
+    """
+    Makes sleep advance a fake clock instead of waiting.
+
+    The tasks here sleep purely so the duration formatter prints 1s. Patching
+    sleep to bump an offset that perf_counter_ns reads back keeps those
+    assertions deterministic while removing the real wall-clock wait.
+    """
+    offset = 0
+    real_perf_counter_ns = time.perf_counter_ns
+
+    def fake_sleep(seconds) -> None:
+        nonlocal offset
+        offset += int(seconds * 1_000_000_000)
+
+    def fake_perf_counter_ns() -> int:
+        return real_perf_counter_ns() + offset
+
+    monkeypatch.setattr(f'{__name__}.sleep', fake_sleep)
+    monkeypatch.setattr(time, 'perf_counter_ns', fake_perf_counter_ns)
+
 
 @input_data
 def get_data() -> dict:
@@ -29,7 +83,27 @@ def get_data() -> dict:
       A dict of data to load into context.
     """
     return {
-        settings.data_dir: {
+        DATA_DIR: {
+            'test_fixture': 'test.txt',
+            'a_test_fixture': 'test.txt',
+            'b_test_fixture': 'test.txt',
+            'another_fixture': 'test.txt',
+        },
+    }
+
+
+@input_data(memoize=False, analyze=False)
+def get_data_uncached() -> dict:
+    """
+    A @input_data implementation that always hits the handler, for timing tests.
+
+    Returns
+    -------
+    data: dict
+      A dict of data to load into context.
+    """
+    return {
+        DATA_DIR: {
             'test_fixture': 'test.txt',
             'a_test_fixture': 'test.txt',
             'b_test_fixture': 'test.txt',
@@ -49,7 +123,7 @@ def get_missing_nonoptional_file() -> dict:
         A dictionary describing the assets to be loaded.
     """
     return {
-        settings.data_dir: {
+        DATA_DIR: {
             'missing_nonoptional': {'file': 'missing_nonoptional.csv', 'optional': False},
         }
     }
@@ -66,7 +140,7 @@ def get_missing_optional_file_without_schema() -> dict:
         A dictionary describing the assets to be loaded.
     """
     return {
-        settings.data_dir: {
+        DATA_DIR: {
             'missing_optional': {
                 'optional': True,
                 'file': 'missing_optional.csv',
@@ -75,6 +149,23 @@ def get_missing_optional_file_without_schema() -> dict:
     }
 
 
+@input_data
+def get_subdirectory_data() -> dict:
+    """
+    A @input_data implementation whose asset name reaches into a subdirectory.
+
+    Returns
+    -------
+    data: dict
+      A dict of data to load into context.
+    """
+    return {
+        DATA_DIR: {
+            'nested_fixture': 'sub/test.txt',
+        },
+    }
+
+
 @task
 def transform_data(a: int, b: int) -> tuple:
     """
@@ -100,7 +191,7 @@ def dump_data() -> dict:
       Data to dump from the context object.
     """
     return {
-        settings.data_dir: {
+        DATA_DIR: {
             'another_fixture': {
                 'formats': ('csv', 'sql'),
                 'output_kwargs': {
@@ -140,7 +231,7 @@ def missing_dump_data() -> dict:
       Data to dump from the context object.
     """
     return {
-        settings.data_dir: {
+        DATA_DIR: {
             'missing_some_stuff': {
                 'formats': ('csv', 'sql'),
                 'output_kwargs': {},
@@ -160,6 +251,27 @@ def run_flow() -> None:
     dump_data()
 
 
+def assert_in_order(log: str, fragments: tuple) -> None:
+    """
+    Asserts the fragments appear in the log in the given order.
+
+    A single forward scan with str.find replaces one full substring walk per
+    fragment, and encodes that log lines arrive in temporal order.
+
+    Parameters
+    ----------
+    log: str
+        The captured log output.
+    fragments: tuple
+        The expected substrings, in order of appearance.
+    """
+    position = 0
+    for fragment in fragments:
+        index = log.find(fragment, position)
+        assert index >= 0, f'missing {fragment!r}'
+        position = index + len(fragment)
+
+
 def test_input_decorator() -> None:
     """
     Tests the input_data decorator, both good and bad.
@@ -172,7 +284,8 @@ def test_input_decorator() -> None:
     fixture = context.get_data_reference('test_fixture')
     log_output = capture.get()
     assert 'Handling asset: test.txt' in log_output
-    assert 'Loaded asset: ./raritan/tests/fixture/test.txt <1s 9bbb4fc759'
+    # The analysis handler's message has no colon, unlike the default one.
+    assert f'Loaded asset {DATA_DIR}/test.txt <1s {SINGLE_FIXTURE_DIGEST}' in log_output
     assert fixture
     assert 'A tiny fixture for testing IO.' in fixture
 
@@ -185,10 +298,12 @@ def test_task_decorator() -> None:
         a_sum, a_product = transform_data(2, 3)
         b_sum, b_product = transform_data(4, 5, task_description='something_else')
     log_output = capture.get()
-    assert 'Beginning task: transform_data' in log_output
-    assert 'Completed task: transform_data 1s' in log_output
-    assert 'Beginning task: something_else' in log_output
-    assert 'Completed task: something_else 1s' in log_output
+    assert_in_order(log_output, (
+        'Beginning task: transform_data',
+        'Completed task: transform_data 1s',
+        'Beginning task: something_else',
+        'Completed task: something_else 1s',
+    ))
     assert a_sum == 5
     assert a_product == 6
     assert b_sum == 9
@@ -210,10 +325,12 @@ def test_input_dictionary_messages() -> None:
     """
     with console.capture() as capture:  # Place console capture context manager here
         get_missing_optional_file_without_schema()
-    log_output = remove_ansi_escape_sequences(capture.get())
-    assert 'Handling asset: missing_optional.csv' in log_output
-    assert 'Optional file missing: missing_optional.csv, using default dictionary.' in log_output
-    assert 'Error occurred: No default dictionary provided.' in log_output
+    log_output = capture.get()
+    assert_in_order(log_output, (
+        'Handling asset: missing_optional.csv',
+        'Optional file missing: missing_optional.csv, using default dictionary.',
+        'Error occurred: No default dictionary provided.',
+    ))
 
 
 def test_input_nonoptional_messages() -> None:
@@ -229,89 +346,103 @@ def test_input_nonoptional_messages() -> None:
     """
     with console.capture() as capture:  # Place console capture context manager here
         get_missing_nonoptional_file()
-    log_output = remove_ansi_escape_sequences(capture.get())
-    assert 'Handling asset: missing_nonoptional.csv' in log_output
-    # Check if the log message "Non-Optional file missing: missing_nonoptional.csv" is present
-    assert 'Error occurred: Non-Optional file missing: missing_nonoptional.csv' in log_output
+    log_output = capture.get()
+    assert_in_order(log_output, (
+        'Handling asset: missing_nonoptional.csv',
+        'Error occurred: Non-Optional file missing: missing_nonoptional.csv',
+    ))
 
 
-def remove_ansi_escape_sequences(text):
+def test_input_subdirectory_asset(isolated_data_dir) -> None:
     """
-    Removes ANSI escape sequences (color codes and formatting) from a given text string.
+    Tests that an asset name containing a subdirectory is found and loaded.
+    """
+    os.makedirs(f'{isolated_data_dir}/sub')
+    shutil.copy(f'{isolated_data_dir}/test.txt', f'{isolated_data_dir}/sub')
+    with console.capture() as capture:
+        get_subdirectory_data()
+    log_output = capture.get()
+    assert 'Non-Optional file missing' not in log_output
+    assert 'A tiny fixture for testing IO.' in context.get_data_reference('nested_fixture')
 
-    Parameters
-    ----------
-    text: str
-        The input text containing ANSI escape sequences.
 
-    Returns
-    -------
-    str
-        A new string with ANSI escape sequences removed.
+def test_flow_parallel_input(monkeypatch) -> None:
     """
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    Tests that independent assets load concurrently rather than back to back.
+    """
+    delay = 0.05
+
+    def slow_handler(path: str, file: str) -> str:
+        time.sleep(delay)
+        return 'slow'
+
+    monkeypatch.setattr(settings, 'input_handler', slow_handler)
+    start = time.perf_counter()
+    with console.capture():
+        get_data_uncached()
+    elapsed = time.perf_counter() - start
+    # Four overlapping reads should cost about one delay, not four.
+    assert elapsed < delay * 4 * 0.75
 
 
-def test_output_decorator() -> None:
+@pytest.fixture
+def loaded_context():
+    """
+    Provides a context populated with the standard input fixtures.
+
+    Tests that only exercise the output path consume this instead of calling
+    get_data inline. Each test gets a fresh copy of the fixtures under its own
+    tmp_path, so the loads here do hit the disk; the fixture only keeps the
+    setup out of the test bodies.
+    """
+    with console.capture():
+        get_data()
+    yield context
+
+
+def test_output_decorator(isolated_data_dir, loaded_context) -> None:
     """
     Tests the output decorator both good and bad.
     """
     with console.capture() as capture:
-        get_data()
         context.print_all_data_references()
         dump_data()
-    log_output = remove_ansi_escape_sequences(capture.get())
-    # Test the one to one output.
-    assert 'Beginning output: another_fixture in format csv' in log_output
-    assert 'Finished output: ./raritan/tests/fixture/another_fixture.csv <1s 9bbb4fc759' in log_output
-    assert 'Beginning output: another_fixture in format sql' in log_output
-    assert 'Finished output: ./raritan/tests/fixture/another_fixture.sql <1s 9bbb4fc759' in log_output
-    assert 'Beginning output: fixture_group in format csv' in log_output
-    assert 'Finished output: ./raritan/tests/fixture/fixture_group.zip <1s bc63b64f5a' in log_output
-    assert 'Beginning output: different_fixture_group in format csv' in log_output
-    assert 'Finished output: ./raritan/tests/fixture/different_fixture_group.zip <1s' in log_output
-    assert '8a79d95e42' in log_output
-    assert os.path.isfile(f'{settings.data_dir}/another_fixture.csv')
-    assert os.path.isfile(f'{settings.data_dir}/another_fixture.sql')
-    assert os.path.isfile(f'{settings.data_dir}/fixture_group.zip')
-    assert os.path.isfile(f'{settings.data_dir}/different_fixture_group.zip')
-
-
-def test_flow_decorator() -> None:
+    log_output = capture.get()
+    # Test the one to one output. All outputs begin before any finish, since the
+    # writes are submitted together and drained afterwards.
+    assert_in_order(log_output, (
+        'Beginning output: another_fixture in format csv',
+        'Beginning output: another_fixture in format sql',
+        'Beginning output: fixture_group in format csv',
+        'Beginning output: different_fixture_group in format csv',
+        f'Finished output: {isolated_data_dir}/another_fixture.csv <1s {SINGLE_FIXTURE_DIGEST}',
+        f'Finished output: {isolated_data_dir}/another_fixture.sql <1s {SINGLE_FIXTURE_DIGEST}',
+        f'Finished output: {isolated_data_dir}/fixture_group.zip <1s {FIXTURE_GROUP_DIGEST}',
+        f'Finished output: {isolated_data_dir}/different_fixture_group.zip <1s {DIFFERENT_FIXTURE_GROUP_DIGEST}',
+    ))
+    # One directory read covers all the expected outputs.
+    produced = {entry.name for entry in os.scandir(isolated_data_dir) if entry.is_file()}
+    expected = {'another_fixture.csv', 'another_fixture.sql', 'fixture_group.zip', 'different_fixture_group.zip'}
+    assert expected <= produced
+
+
+def test_flow_decorator(isolated_data_dir) -> None:
     """
     Tests the flow decorator.
     """
     with console.capture() as capture:
         run_flow()
-    log_output = remove_ansi_escape_sequences(capture.get())
-    assert 'Beginning flow: test_decorators' in log_output
-    assert 'Started' in log_output
-    assert 'Loaded asset' in log_output
-    assert 'Beginning task: transform_data' in log_output
-    assert 'Completed task: transform_data 1s' in log_output
-    assert 'Beginning output: another_fixture in format csv' in log_output
-    assert 'Finished output: ./raritan/tests/fixture/another_fixture.csv <1s' in log_output
-    assert 'Beginning output: another_fixture in format sql' in log_output
-    assert 'Finished output: ./raritan/tests/fixture/another_fixture.sql <1s' in log_output
-    assert 'Completed flow run!' in log_output
-    assert 'Total duration 1s' in log_output
-
-
-def setup_function() -> None:
-    """
-     Performs setup steps.
-    """
-    context.clear_data_references()
-
-
-def teardown_function() -> None:
-    """
-    Removes any leftover output files.
-    """
-    fixtures = []
-    for extension in ('csv', 'sql', 'zip'):
-        fixtures += glob.glob(f'{settings.data_dir}/*.{extension}')
-    for item in fixtures:
-        if os.path.isfile(item):
-            os.remove(item)
+    log_output = capture.get()
+    assert_in_order(log_output, (
+        'Beginning flow: test_decorators',
+        'Started',
+        'Loaded asset',
+        'Beginning task: transform_data',
+        'Completed task: transform_data 1s',
+        'Beginning output: another_fixture in format csv',
+        'Beginning output: another_fixture in format sql',
+        f'Finished output: {isolated_data_dir}/another_fixture.csv <1s',
+        f'Finished output: {isolated_data_dir}/another_fixture.sql <1s',
+        'Completed flow run!',
+        'Total duration 1s',
+    ))
@@ -24,3 +24,11 @@ def test_formatting_some_durations() -> None:
     end = start
     duration = _get_formatted_duration(start, end)
     assert duration == '<1s'
+    # Sub-second durations below the rounding threshold take the fast path.
+    end = start + datetime.timedelta(seconds=0.4)
+    duration = _get_formatted_duration(start, end)
+    assert duration == '<1s'
+    # Durations at or past half a second still round up to a whole second.
+    end = start + datetime.timedelta(seconds=0.9)
+    duration = _get_formatted_duration(start, end)
+    assert duration == '1s'